@@ -35,6 +35,10 @@ except Exception:
     raise
 
 
+# Remembers where the word list was found so later launches skip the search
+WORDLIST_PATH_CACHE = os.path.join(os.path.expanduser('~'), '.hangman_wordlist_path')
+
+
 def find_wordlist():
     here = os.path.dirname(os.path.abspath(__file__))
     candidates = [
@@ -43,23 +47,108 @@ def find_wordlist():
         os.path.join(here, '..', 'bad hangman', 'random_common_words_20000.txt'),
         os.path.join(here, '..', 'random_common_words_20000.txt'),
     ]
+    # try the path that worked last time first
+    try:
+        with open(WORDLIST_PATH_CACHE, 'r', encoding='utf-8') as f:
+            cached = f.read().strip()
+    except Exception:
+        cached = ''
+    if cached:
+        candidates.insert(0, cached)
     for path in candidates:
-        if os.path.isfile(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    words = [w.strip() for w in f if w.strip()]
-                    words = [w for w in words if all(ch.isalpha() for ch in w)]
-                    if words:
-                        return [w.upper() for w in words]
-            except Exception:
-                pass
+        # open directly instead of checking isfile() first; missing paths just fail
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                # strip, keep letters-only words and uppercase in a single pass
+                words = [w.upper() for w in (line.strip() for line in f) if w and w.isalpha()]
+        except Exception:
+            continue
+        if words:
+            path = os.path.abspath(path)
+            if path != cached:
+                try:
+                    with open(WORDLIST_PATH_CACHE, 'w', encoding='utf-8') as f:
+                        f.write(path)
+                except Exception:
+                    pass
+            return words
     return []
 
 
+class ConfettiPiece:
+    """A single confetti particle: position, velocity, size and color."""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'size', 'color')
+
+    def __init__(self, x, y, vx, vy, size, color):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+        self.color = color
+
+
+def _step_confetti(pieces, gravity, max_y):
+    """Advance confetti pieces one frame and return the ones still on screen."""
+    alive = []
+    keep = alive.append
+    for piece in pieces:
+        piece.x += piece.vx
+        y = piece.y = piece.y + piece.vy
+        # rotate gravity slightly
+        piece.vy += gravity
+        if y <= max_y:
+            keep(piece)
+    return alive
+
+
 class PygameHangman:
     """Main Hangman game class using pygame."""
     WIDTH = 500
     HEIGHT = 500
+    CONFETTI_COLORS = [(255,77,77),(77,255,77),(77,77,255),(255,255,77),(255,77,255),(77,255,255)]
+    CONFETTI_SIZES = range(3, 8)
+
+    # Colors used on the draw paths
+    _BLACK = (0,0,0)
+    _GREEN = (0,180,0)
+    _LGREEN = (102,255,102)
+    _HEAD_FILL = (230,230,230)
+
+    # Hangman geometry, relative to the head center
+    _HEAD_CENTER = (420, 170)
+    _HEAD_OFFSET = 18  # head radius / neck
+    _ARM_Y = 38
+    _ARM_DX = 30
+    _HAND_Y = 58
+    _LEG_Y = 88
+    _LEG_DX = 20
+    _LEG_DY = 128
+
+    # Fixed attribute layout: slot access is cheaper than the per-instance dict
+    # lookups the main loop otherwise does for every self.<attr> on every frame.
+    # Any new instance attribute has to be listed here.
+    __slots__ = (
+        # pygame resources
+        'screen', 'clock', 'font', 'big_font', 'small_font', '_handled_events', '_repaint_events',
+        # pre-rendered surfaces and static layers
+        '_letter_cache_dark', '_letter_cache_light', '_grave_letter_cache',
+        '_start_text', '_restart_text', '_start_hint_text', '_win_text', '_lose_text',
+        '_reveal_text', '_bg', '_selection_layer', '_figure_cache',
+        # character selection
+        'character_selected', 'selecting_character', 'character_rects',
+        # round state
+        'word_list', 'running', 'in_round', 'chosen_word', 'guessed', 'wrong_guesses', '_tried',
+        '_won', '_lost', '_word_set', '_remaining', '_loss_counter',
+        'underscores', 'parts_visible', 'removal_order',
+        # layout
+        'grave_x', 'grave_y', 'start_button_rect', 'restart_button_rect',
+        '_start_text_rect', '_restart_text_rect', '_start_hint_rect', '_hangman_points',
+        # confetti
+        'confetti', 'confetti_end_time', '_confetti_sprites',
+        # dirty-rect tracking
+        '_dirty', '_confetti_rect', '_word_rect', '_hangman_rect',
+    )
 
     def __init__(self):
         # Character selection state
@@ -67,12 +156,37 @@ class PygameHangman:
         self.selecting_character = True
         pygame.init()
         pygame.display.set_caption('Hangman Game')
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.DOUBLEBUF)
         self.clock = pygame.time.Clock()
+        # Window/expose events that mean the screen contents must be repainted;
+        # idle frames are skipped, so nothing else would redraw the window.
+        # (pygame 2.0.0 reports them all as WINDOWEVENT, later 2.x splits them up)
+        self._repaint_events = tuple(getattr(pygame, name) for name in (
+            'VIDEOEXPOSE', 'WINDOWEVENT', 'WINDOWSHOWN', 'WINDOWEXPOSED',
+            'WINDOWRESTORED', 'WINDOWMAXIMIZED', 'WINDOWSIZECHANGED') if hasattr(pygame, name))
+        # Only the events handled in run() are queued; mouse motion and the like
+        # are dropped by SDL before they ever reach Python
+        self._handled_events = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN) + self._repaint_events
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._handled_events)
         self.font = pygame.font.SysFont('Helvetica', 20)
         self.big_font = pygame.font.SysFont('Helvetica', 30, bold=True)
         self.small_font = pygame.font.SysFont('Helvetica', 14)
 
+        # Pre-rendered text: font rendering is slow, so rasterize every letter and
+        # static label once and just blit the cached surfaces while drawing.
+        # convert_alpha() matches the display format so blits take the fast path.
+        letters = string.ascii_uppercase
+        self._letter_cache_dark = {ch: self.font.render(ch, True, self._GREEN).convert_alpha() for ch in letters}
+        self._letter_cache_light = {ch: self.font.render(ch, True, self._LGREEN).convert_alpha() for ch in letters}
+        self._grave_letter_cache = {ch: self.small_font.render(ch, True, (200,0,0)).convert_alpha() for ch in letters}
+        self._start_text = self.font.render('Start', True, (255,255,255)).convert_alpha()
+        self._restart_text = self.font.render('Restart', True, (255,255,255)).convert_alpha()
+        self._start_hint_text = self.small_font.render('Click Start to play', True, (80,80,80)).convert_alpha()
+        self._win_text = self.big_font.render('You Win!', True, (0,0,0)).convert_alpha()
+        self._lose_text = self.big_font.render('You Lose!', True, (0,0,0)).convert_alpha()
+        self._reveal_text = None  # 'Word: ...' line, rendered once per lost round
+
         # Load words
         self.word_list = find_wordlist()
         if not self.word_list:
@@ -84,6 +198,15 @@ class PygameHangman:
         self.chosen_word = ''
         self.guessed = set()
         self.wrong_guesses = []
+        self._tried = set()  # every letter guessed this round, right or wrong
+
+        # Cached round outcome, refreshed whenever a guess changes the state
+        self._won = False
+        self._lost = False
+        # Letters of the word, unique letters still hidden and wrong guesses this round
+        self._word_set = frozenset()
+        self._remaining = 0
+        self._loss_counter = 0
 
         # For display
         self.underscores = []  # positions for letter drawing
@@ -108,13 +231,61 @@ class PygameHangman:
         # UI buttons
         self.start_button_rect = pygame.Rect((self.WIDTH//2 - 70, 40, 140, 40))
         self.restart_button_rect = pygame.Rect((self.WIDTH//2 - 70, 40, 140, 40))
+        self._start_text_rect = self._start_text.get_rect(center=self.start_button_rect.center)
+        self._restart_text_rect = self._restart_text.get_rect(center=self.restart_button_rect.center)
+        self._start_hint_rect = self._start_hint_text.get_rect(center=(self.WIDTH//2, self.start_button_rect.bottom + 12))
+
+        # Hangman joint positions, computed once
+        cx, cy = self._HEAD_CENTER
+        neck = (cx, cy+self._HEAD_OFFSET)
+        shoulder = (cx, cy+self._ARM_Y)
+        hip = (cx, cy+self._LEG_Y)
+        self._hangman_points = {
+            'neck': neck,
+            'shoulder': shoulder,
+            'hip': hip,
+            'left_hand': (cx-self._ARM_DX, cy+self._HAND_Y),
+            'right_hand': (cx+self._ARM_DX, cy+self._HAND_Y),
+            'left_foot': (cx-self._LEG_DX, cy+self._LEG_DY),
+            'right_foot': (cx+self._LEG_DX, cy+self._LEG_DY),
+        }
 
-        # Confetti
+        # Static layers drawn once and blitted every frame: the background with
+        # the gallows, and the character selection title, icons and labels
+        self._bg = pygame.Surface((self.WIDTH, self.HEIGHT))
+        self._bg.fill((245,245,245))
+        self.draw_gallows(self._bg)
+        self._bg = self._bg.convert()
+        self.character_rects = self._compute_character_rects()
+        self._selection_layer = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        self.draw_character_selection(self._selection_layer)
+        self._selection_layer = self._selection_layer.convert_alpha()
+        # Background + gallows + hangman, one surface per (character, visible parts)
+        # state, built lazily. Parts disappear in a fixed order, so a round only
+        # ever reaches 7 states.
+        self._figure_cache = {}
+
+        # Confetti, plus one pre-drawn sprite per (color, size) so drawing a
+        # piece is a blit rather than an ellipse rasterization
         self.confetti = []
+        self._confetti_sprites = {}
+        for color in self.CONFETTI_COLORS:
+            for size in self.CONFETTI_SIZES:
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.ellipse(sprite, color, (0, 0, size, size))
+                self._confetti_sprites[(color, size)] = sprite.convert_alpha()
 
         # Timing for confetti (ms) after win
         self.confetti_end_time = 0
 
+        # Dirty rects: screen regions that changed since the last frame was
+        # pushed to the display. The first frame is pushed whole.
+        self._dirty = [self.screen.get_rect()]
+        self._confetti_rect = None
+        # Regions touched by a guess: the word row and the hangman figure
+        self._word_rect = pygame.Rect(0, 395, self.WIDTH, 45)
+        self._hangman_rect = pygame.Rect(385, 140, 70, 165)
+
     # ------------------ Game logic ------------------
     def start_round(self):
         # Only allow if character is selected
@@ -125,10 +296,17 @@ class PygameHangman:
         self.selecting_character = False
         self.guessed = set()
         self.wrong_guesses = []
+        self._tried = set()
         self.chosen_word = random.choice(self.word_list).upper()
+        self._word_set = frozenset(self.chosen_word)
+        self._remaining = len(self._word_set)
+        self._loss_counter = 0
         # reset parts
         for k in self.parts_visible:
             self.parts_visible[k] = True
+        self._won = False
+        self._lost = False
+        self._reveal_text = None
         self.removal_order = ['left_leg', 'right_leg', 'left_arm', 'right_arm', 'body', 'head']
         # build underscores positions (centered)
         n = len(self.chosen_word)
@@ -150,152 +328,204 @@ class PygameHangman:
         # reset confetti
         self.confetti = []
         self.confetti_end_time = 0
-        print('chosen word:', self.chosen_word)
+        self.mark_dirty()
+        if os.environ.get('HANGMAN_DEBUG'):
+            print('chosen word:', self.chosen_word)
 
     def reveal_letter(self, ch):
         """Reveal letter ch in the word (if present). Return True if was present."""
-        present = ch in self.chosen_word
+        self._tried.add(ch)
+        present = ch in self._word_set
         if present:
-            self.guessed.add(ch)
+            if ch not in self.guessed:
+                self.guessed.add(ch)
+                self._remaining -= 1
+            self._won = self.check_win()
+            # a win changes letter colors, buttons and popup: redraw everything
+            self.mark_dirty(None if self._won else self._word_rect)
             return True
         else:
             # wrong guess
             self.wrong_guesses.append(ch)
+            self._loss_counter += 1
             # remove next part
             if self.removal_order:
                 part = self.removal_order.pop(0)
                 self.parts_visible[part] = False
+            self._lost = self.check_lose()
+            if self._lost:
+                self.mark_dirty()
+            else:
+                idx = len(self.wrong_guesses) - 1
+                self.mark_dirty(pygame.Rect(self.grave_x, self.grave_y + idx * 22, 30, 22))
+                self.mark_dirty(self._hangman_rect)
             return False
 
     def check_win(self):
-        return all(ch in self.guessed for ch in self.chosen_word)
+        return self._remaining == 0
 
     def check_lose(self):
-        # lose when no parts remain visible except maybe the gallows
-        return not any(self.parts_visible.values())
+        # lose when every part has been removed (one per wrong guess)
+        return self._loss_counter >= len(self.parts_visible)
 
     # ------------------ Drawing ------------------
-    def draw_gallows(self):
+    def mark_dirty(self, rect=None):
+        """Schedule a screen region (default: the whole screen) for the next display update."""
+        self._dirty.append(self.screen.get_rect() if rect is None else rect)
+
+    def present(self):
+        """Push the dirty regions to the display, falling back to flip() when most of it changed."""
+        if not self._dirty:
+            return
+        if sum(r.w * r.h for r in self._dirty) > self.WIDTH * self.HEIGHT // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty = []
+
+    def draw_gallows(self, surface):
         # base
-        pygame.draw.line(self.screen, (0,0,0), (220, 460), (480, 460), 6)
-        # vertical post
-        pygame.draw.line(self.screen, (0,0,0), (300, 460), (300, 120), 6)
-        # top beam
-        pygame.draw.line(self.screen, (0,0,0), (300, 120), (420, 120), 6)
+        pygame.draw.line(surface, self._BLACK, (220, 460), (480, 460), 6)
+        # vertical post and top beam as one polyline
+        pygame.draw.lines(surface, self._BLACK, False, [(300, 460), (300, 120), (420, 120)], 6)
         # rope
-        pygame.draw.line(self.screen, (0,0,0), (420, 120), (420, 150), 3)
-
-    def draw_hangman(self):
+        pygame.draw.line(surface, self._BLACK, (420, 120), (420, 150), 3)
+
+    def figure_layer(self):
+        """Return the background with the hangman in its current state, drawing it on first use."""
+        key = (self.character_selected, tuple(self.parts_visible.values()))
+        layer = self._figure_cache.get(key)
+        if layer is None:
+            layer = self._bg.copy()
+            self.draw_hangman(layer)
+            self._figure_cache[key] = layer
+        return layer
+
+    def draw_hangman(self, surface=None):
         # Always draw a blank hangman regardless of selection
-        cx, cy = 420, 170  # head center
+        screen = self.screen if surface is None else surface
+        visible = self.parts_visible
+        pts = self._hangman_points
+        black = self._BLACK
+        cx, cy = self._HEAD_CENTER  # head center
         # Head
-        if self.parts_visible['head']:
-            pygame.draw.circle(self.screen, (230,230,230), (cx, cy), 18, 0)
-            pygame.draw.circle(self.screen, (0,0,0), (cx, cy), 18, 2)
+        if visible['head']:
+            pygame.draw.circle(screen, self._HEAD_FILL, self._HEAD_CENTER, self._HEAD_OFFSET, 0)
+            pygame.draw.circle(screen, black, self._HEAD_CENTER, self._HEAD_OFFSET, 2)
             # Add character-specific features
             if self.character_selected == 'angry':
                 # Top hat for character 1
                 hat_w = 14
                 hat_h = 7
                 brim_h = 3
-                pygame.draw.rect(self.screen, (0,0,0), (cx-hat_w//2, cy-18-6, hat_w, hat_h))
-                pygame.draw.rect(self.screen, (0,0,0), (cx-hat_w, cy-18-6+hat_h, hat_w*2, brim_h))
+                pygame.draw.rect(screen, black, (cx-hat_w//2, cy-self._HEAD_OFFSET-6, hat_w, hat_h))
+                pygame.draw.rect(screen, black, (cx-hat_w, cy-self._HEAD_OFFSET-6+hat_h, hat_w*2, brim_h))
             elif self.character_selected == 'short':
                 # Mustache for character 2
-                pygame.draw.line(self.screen, (0,0,0), (cx - 10, cy + 4), (cx - 2, cy + 2), 2)
-                pygame.draw.line(self.screen, (0,0,0), (cx + 10, cy + 4), (cx + 2, cy + 2), 2)
-                pygame.draw.line(self.screen, (0,0,0), (cx - 4, cy + 5), (cx + 4, cy + 5), 1)
+                pygame.draw.line(screen, black, (cx - 10, cy + 4), (cx - 2, cy + 2), 2)
+                pygame.draw.line(screen, black, (cx + 10, cy + 4), (cx + 2, cy + 2), 2)
+                pygame.draw.line(screen, black, (cx - 4, cy + 5), (cx + 4, cy + 5), 1)
             elif self.character_selected == 'witchy':
                 # Eyebrows for character 3
-                pygame.draw.line(self.screen, (0,0,0), (cx - 11, cy - 8), (cx - 3, cy - 10), 2)
-                pygame.draw.line(self.screen, (0,0,0), (cx + 3, cy - 10), (cx + 11, cy - 8), 2)
-        # Body
-        if self.parts_visible['body']:
-            pygame.draw.line(self.screen, (0,0,0), (cx, cy+18), (cx, cy+88), 2)
-        # Arms
-        if self.parts_visible['left_arm']:
-            pygame.draw.line(self.screen, (0,0,0), (cx, cy+38), (cx-30, cy+58), 2)
-        if self.parts_visible['right_arm']:
-            pygame.draw.line(self.screen, (0,0,0), (cx, cy+38), (cx+30, cy+58), 2)
+                pygame.draw.line(screen, black, (cx - 11, cy - 8), (cx - 3, cy - 10), 2)
+                pygame.draw.line(screen, black, (cx + 3, cy - 10), (cx + 11, cy - 8), 2)
+        # Body (continued into the right leg as one polyline while both are visible)
+        if visible['body'] and visible['right_leg']:
+            pygame.draw.lines(screen, black, False, [pts['neck'], pts['hip'], pts['right_foot']], 2)
+        elif visible['body']:
+            pygame.draw.line(screen, black, pts['neck'], pts['hip'], 2)
+        # Arms (one polyline through the shoulder while both are visible)
+        if visible['left_arm'] and visible['right_arm']:
+            pygame.draw.lines(screen, black, False, [pts['left_hand'], pts['shoulder'], pts['right_hand']], 2)
+        elif visible['left_arm']:
+            pygame.draw.line(screen, black, pts['shoulder'], pts['left_hand'], 2)
+        elif visible['right_arm']:
+            pygame.draw.line(screen, black, pts['shoulder'], pts['right_hand'], 2)
         # Legs
-        if self.parts_visible['left_leg']:
-            pygame.draw.line(self.screen, (0,0,0), (cx, cy+88), (cx-20, cy+128), 2)
-        if self.parts_visible['right_leg']:
-            pygame.draw.line(self.screen, (0,0,0), (cx, cy+88), (cx+20, cy+128), 2)
-
-    def draw_underscores_and_letters(self):
+        if visible['left_leg']:
+            pygame.draw.line(screen, black, pts['hip'], pts['left_foot'], 2)
+        if visible['right_leg'] and not visible['body']:
+            pygame.draw.line(screen, black, pts['hip'], pts['right_foot'], 2)
+
+    def draw_underscores_and_letters(self, won):
+        # green letters above underscores, lighter green once won
+        if won:
+            cache, color = self._letter_cache_light, self._LGREEN
+        else:
+            cache, color = self._letter_cache_dark, self._GREEN
+        black = self._BLACK
         for i, (x, y) in enumerate(self.underscores):
             # underscore line
-            pygame.draw.line(self.screen, (0,0,0), (x-10, y), (x+10, y), 2)
+            pygame.draw.line(self.screen, black, (x-10, y), (x+10, y), 2)
             ch = self.chosen_word[i]
             if ch in self.guessed:
-                # green letter above underscore
-                color = (0,180,0)
-                # if won, lighter green
-                if self.check_win():
-                    color = (102,255,102)
-                text = self.font.render(ch, True, color)
+                text = cache.get(ch)
+                if text is None:
+                    # letters outside A-Z are rendered on first use
+                    text = cache[ch] = self.font.render(ch, True, color).convert_alpha()
                 rect = text.get_rect(center=(x, y-16))
                 self.screen.blit(text, rect)
 
     def draw_graveyard(self):
         # show wrong guesses vertically starting at grave_y
         for idx, ch in enumerate(self.wrong_guesses):
-            text = self.small_font.render(ch, True, (200,0,0))
+            text = self._grave_letter_cache[ch]
             self.screen.blit(text, (self.grave_x, self.grave_y + idx * 22))
 
     def draw_buttons(self):
         if self.selecting_character:
             # Draw character selection
-            self.draw_character_selection()
+            self.screen.blit(self._selection_layer, (0, 0))
         elif not self.in_round:
             # draw Start button
             pygame.draw.rect(self.screen, (76,175,80), self.start_button_rect)
-            text = self.font.render('Start', True, (255,255,255))
-            rect = text.get_rect(center=self.start_button_rect.center)
-            self.screen.blit(text, rect)
-            hint = self.small_font.render('Click Start to play', True, (80,80,80))
-            hint_rect = hint.get_rect(center=(self.WIDTH//2, self.start_button_rect.bottom + 12))
-            self.screen.blit(hint, hint_rect)
+            self.screen.blit(self._start_text, self._start_text_rect)
+            self.screen.blit(self._start_hint_text, self._start_hint_rect)
         # Draw restart button when game over
-        if self.in_round and (self.check_win() or self.check_lose()):
+        if self.in_round and (self._won or self._lost):
             pygame.draw.rect(self.screen, (33,150,243), self.restart_button_rect)
-            text = self.font.render('Restart', True, (255,255,255))
-            rect = text.get_rect(center=self.restart_button_rect.center)
-            self.screen.blit(text, rect)
+            self.screen.blit(self._restart_text, self._restart_text_rect)
 
-    def draw_character_selection(self):
-        # Draw three identical blank hangman heads, label 1, 2, 3, and put title above
+    def _compute_character_rects(self):
+        """Return the click/frame rects of the three character choices (fixed layout)."""
         top_y = 50
         icon_size = 36
         spacing = 90
         base_x = self.WIDTH//2 - spacing
+        return [
+            pygame.Rect(base_x-50, top_y, icon_size, icon_size*2),
+            pygame.Rect(base_x+spacing, top_y, icon_size, icon_size*2),
+            pygame.Rect(base_x+2*spacing+50, top_y, icon_size, icon_size*2),
+        ]
+
+    def draw_character_selection(self, surface=None):
+        # Draw three identical blank hangman heads, label 1, 2, 3, and put title above
+        if surface is None:
+            surface = self.screen
+        rect1, rect2, rect3 = self.character_rects
         # Title above characters, but within frame
         title = self.big_font.render('Choose Your Hangman', True, (0,0,0))
-        self.screen.blit(title, title.get_rect(center=(self.WIDTH//2, 30)))
+        surface.blit(title, title.get_rect(center=(self.WIDTH//2, 30)))
         # Left: blank hangman with a small top hat
-        rect1 = pygame.Rect(base_x-50, top_y, icon_size, icon_size*2)
-        self.draw_character_icon('blankman_hat', rect1.centerx, rect1.centery-10, small=True)
-        pygame.draw.rect(self.screen, (0,0,0), rect1, 2)
+        self.draw_character_icon('blankman_hat', rect1.centerx, rect1.centery-10, small=True, surface=surface)
+        pygame.draw.rect(surface, (0,0,0), rect1, 2)
         label = self.small_font.render('1', True, (0,0,0))
-        self.screen.blit(label, label.get_rect(center=(rect1.centerx, rect1.bottom+10)))
+        surface.blit(label, label.get_rect(center=(rect1.centerx, rect1.bottom+10)))
         # Middle: blank hangman with mustache (choice 2)
-        rect2 = pygame.Rect(base_x+spacing, top_y, icon_size, icon_size*2)
-        self.draw_character_icon('blankman_mustache', rect2.centerx, rect2.centery-10, small=True)
-        pygame.draw.rect(self.screen, (0,0,0), rect2, 2)
+        self.draw_character_icon('blankman_mustache', rect2.centerx, rect2.centery-10, small=True, surface=surface)
+        pygame.draw.rect(surface, (0,0,0), rect2, 2)
         label = self.small_font.render('2', True, (0,0,0))
-        self.screen.blit(label, label.get_rect(center=(rect2.centerx, rect2.bottom+10)))
+        surface.blit(label, label.get_rect(center=(rect2.centerx, rect2.bottom+10)))
         # Right: blank hangman with eyebrows (choice 3)
-        rect3 = pygame.Rect(base_x+2*spacing+50, top_y, icon_size, icon_size*2)
-        self.draw_character_icon('blankman_eyebrows', rect3.centerx, rect3.centery-10, small=True)
-        pygame.draw.rect(self.screen, (0,0,0), rect3, 2)
+        self.draw_character_icon('blankman_eyebrows', rect3.centerx, rect3.centery-10, small=True, surface=surface)
+        pygame.draw.rect(surface, (0,0,0), rect3, 2)
         label = self.small_font.render('3', True, (0,0,0))
-        self.screen.blit(label, label.get_rect(center=(rect3.centerx, rect3.bottom+10)))
-        # Store rects for click detection
-        self.character_rects = [rect1, rect2, rect3]
+        surface.blit(label, label.get_rect(center=(rect3.centerx, rect3.bottom+10)))
 
-    def draw_character_icon(self, char, cx, cy, small=False):
+    def draw_character_icon(self, char, cx, cy, small=False, surface=None):
         # Draw a small version of the character for selection
+        if surface is None:
+            surface = self.screen
         if small:
             scale = 0.6
         else:
@@ -304,95 +534,116 @@ class PygameHangman:
             r = int(18 * scale)
             offset = int(20 * scale)
             # Blank hangman head (plain circle)
-            pygame.draw.circle(self.screen, (230,230,230), (cx, cy-offset), r, 0)
-            pygame.draw.circle(self.screen, (0,0,0), (cx, cy-offset), r, 2)
+            pygame.draw.circle(surface, (230,230,230), (cx, cy-offset), r, 0)
+            pygame.draw.circle(surface, (0,0,0), (cx, cy-offset), r, 2)
         elif char == 'blankman_mustache':
             r = int(18 * scale)
             offset = int(20 * scale)
             # Head
-            pygame.draw.circle(self.screen, (230,230,230), (cx, cy-offset), r, 0)
-            pygame.draw.circle(self.screen, (0,0,0), (cx, cy-offset), r, 2)
+            pygame.draw.circle(surface, (230,230,230), (cx, cy-offset), r, 0)
+            pygame.draw.circle(surface, (0,0,0), (cx, cy-offset), r, 2)
             # Eyes
             eye_r = max(1, int(2 * scale))
-            pygame.draw.circle(self.screen, (0,0,0), (cx - int(6*scale), cy - offset + int(2*scale)), eye_r)
-            pygame.draw.circle(self.screen, (0,0,0), (cx + int(6*scale), cy - offset + int(2*scale)), eye_r)
+            pygame.draw.circle(surface, (0,0,0), (cx - int(6*scale), cy - offset + int(2*scale)), eye_r)
+            pygame.draw.circle(surface, (0,0,0), (cx + int(6*scale), cy - offset + int(2*scale)), eye_r)
             # Mustache (simple lines)
             line_w = max(1, int(2 * scale))
-            pygame.draw.line(self.screen, (0,0,0), (cx - int(10*scale), cy - offset + int(4*scale)), (cx - int(2*scale), cy - offset + int(2*scale)), line_w)
-            pygame.draw.line(self.screen, (0,0,0), (cx + int(10*scale), cy - offset + int(4*scale)), (cx + int(2*scale), cy - offset + int(2*scale)), line_w)
-            pygame.draw.line(self.screen, (0,0,0), (cx - int(4*scale), cy - offset + int(5*scale)), (cx + int(4*scale), cy - offset + int(5*scale)), max(1, int(1*scale)))
+            pygame.draw.line(surface, (0,0,0), (cx - int(10*scale), cy - offset + int(4*scale)), (cx - int(2*scale), cy - offset + int(2*scale)), line_w)
+            pygame.draw.line(surface, (0,0,0), (cx + int(10*scale), cy - offset + int(4*scale)), (cx + int(2*scale), cy - offset + int(2*scale)), line_w)
+            pygame.draw.line(surface, (0,0,0), (cx - int(4*scale), cy - offset + int(5*scale)), (cx + int(4*scale), cy - offset + int(5*scale)), max(1, int(1*scale)))
         elif char == 'blankman_eyebrows':
             r = int(18 * scale)
             offset = int(20 * scale)
             # Head
-            pygame.draw.circle(self.screen, (230,230,230), (cx, cy-offset), r, 0)
-            pygame.draw.circle(self.screen, (0,0,0), (cx, cy-offset), r, 2)
+            pygame.draw.circle(surface, (230,230,230), (cx, cy-offset), r, 0)
+            pygame.draw.circle(surface, (0,0,0), (cx, cy-offset), r, 2)
             # Eyes
             eye_r = max(1, int(2 * scale))
-            pygame.draw.circle(self.screen, (0,0,0), (cx - int(6*scale), cy - offset + int(2*scale)), eye_r)
-            pygame.draw.circle(self.screen, (0,0,0), (cx + int(6*scale), cy - offset + int(2*scale)), eye_r)
+            pygame.draw.circle(surface, (0,0,0), (cx - int(6*scale), cy - offset + int(2*scale)), eye_r)
+            pygame.draw.circle(surface, (0,0,0), (cx + int(6*scale), cy - offset + int(2*scale)), eye_r)
             # Eyebrows (slanted lines above eyes)
             line_w = max(1, int(2 * scale))
-            pygame.draw.line(self.screen, (0,0,0), (cx - int(11*scale), cy - offset - int(8*scale)), (cx - int(3*scale), cy - offset - int(10*scale)), line_w)
-            pygame.draw.line(self.screen, (0,0,0), (cx + int(3*scale), cy - offset - int(10*scale)), (cx + int(11*scale), cy - offset - int(8*scale)), line_w)
+            pygame.draw.line(surface, (0,0,0), (cx - int(11*scale), cy - offset - int(8*scale)), (cx - int(3*scale), cy - offset - int(10*scale)), line_w)
+            pygame.draw.line(surface, (0,0,0), (cx + int(3*scale), cy - offset - int(10*scale)), (cx + int(11*scale), cy - offset - int(8*scale)), line_w)
         elif char == 'blankman_hat':
             r = int(18 * scale)
             offset = int(20 * scale)
             # Blank hangman head (plain circle)
-            pygame.draw.circle(self.screen, (230,230,230), (cx, cy-offset), r, 0)
-            pygame.draw.circle(self.screen, (0,0,0), (cx, cy-offset), r, 2)
+            pygame.draw.circle(surface, (230,230,230), (cx, cy-offset), r, 0)
+            pygame.draw.circle(surface, (0,0,0), (cx, cy-offset), r, 2)
             # Small top hat (fits within frame) - reduced size
             hat_w = int(10 * scale)
             hat_h = int(4 * scale)
             brim_h = int(2 * scale)
-            pygame.draw.rect(self.screen, (0,0,0), (cx-hat_w//2, cy-offset-r-4, hat_w, hat_h))
-            pygame.draw.rect(self.screen, (0,0,0), (cx-hat_w-2, cy-offset-r-4+hat_h, hat_w*2+4, brim_h))
+            pygame.draw.rect(surface, (0,0,0), (cx-hat_w//2, cy-offset-r-4, hat_w, hat_h))
+            pygame.draw.rect(surface, (0,0,0), (cx-hat_w-2, cy-offset-r-4+hat_h, hat_w*2+4, brim_h))
 
     def spawn_confetti(self):
-        # create small confetti pieces
-        colors = [(255,77,77),(77,255,77),(77,77,255),(255,255,77),(255,77,255),(77,255,255)]
-        for i in range(40):
-            x = random.randint(10, self.WIDTH-10)
-            y = random.randint(-100, -10)
-            vx = random.uniform(-1.5, 1.5)
-            vy = random.uniform(1, 4)
-            size = random.randint(3,7)
-            self.confetti.append([x, y, vx, vy, size, random.choice(colors)])
+        # create small confetti pieces; colors and sizes are drawn in one batch and
+        # positions/velocities are scaled from random.random() rather than going
+        # through randint()/uniform() for every value
+        n = 40
+        rand = random.random
+        colors = random.choices(self.CONFETTI_COLORS, k=n)
+        sizes = random.choices(self.CONFETTI_SIZES, k=n)
+        x_span = self.WIDTH - 19  # x in [10, WIDTH-10]
+        for color, size in zip(colors, sizes):
+            x = 10 + int(rand() * x_span)
+            y = -100 + int(rand() * 91)  # y in [-100, -10]
+            vx = rand() * 3 - 1.5
+            vy = 1 + rand() * 3
+            self.confetti.append(ConfettiPiece(x, y, vx, vy, size, color))
         self.confetti_end_time = pygame.time.get_ticks() + 3000
 
     def update_confetti(self):
-        now = pygame.time.get_ticks()
-        for piece in list(self.confetti):
-            piece[0] += piece[2]
-            piece[1] += piece[3]
-            # rotate gravity slightly
-            piece[3] += 0.05
-            if piece[1] > self.HEIGHT + 20:
-                try:
-                    self.confetti.remove(piece)
-                except ValueError:
-                    pass
-        # if time up, clear after small delay
-        if now > self.confetti_end_time and self.confetti_end_time != 0:
-            if not self.confetti:
-                self.confetti_end_time = 0
+        self.confetti = _step_confetti(self.confetti, 0.05, self.HEIGHT + 20)
+        if not self.confetti and self._confetti_rect is not None:
+            # last pieces fell off: clear where they were drawn
+            self.mark_dirty(self._confetti_rect)
+            self._confetti_rect = None
+
+    def expire_confetti(self):
+        """Mark the burst as finished once its time is up and every piece has fallen.
+
+        Called every loop pass, not only while pieces exist: they can all fall off
+        before the deadline, after which update_confetti no longer runs.
+        """
+        if self.confetti_end_time != 0 and not self.confetti and pygame.time.get_ticks() > self.confetti_end_time:
+            self.confetti_end_time = 0
 
     def draw_confetti(self):
-        for piece in self.confetti:
-            x, y, vx, vy, size, color = piece
-            pygame.draw.ellipse(self.screen, color, (int(x), int(y), size, size))
+        sprites = self._confetti_sprites
+        rects = self.screen.blits([(sprites[(piece.color, piece.size)], (int(piece.x), int(piece.y)))
+                                   for piece in self.confetti])
+        # the display must be refreshed where the pieces are now and where they were
+        rect = rects[0].unionall(rects)
+        if self._confetti_rect is not None:
+            self.mark_dirty(rect.union(self._confetti_rect))
+        else:
+            self.mark_dirty(rect)
+        self._confetti_rect = rect
 
     # ------------------ Main loop ------------------
     def run(self):
         while self.running:
-            for event in pygame.event.get():
+            if self._dirty or self.confetti:
+                events = pygame.event.get(self._handled_events)
+            else:
+                # Nothing changed and nothing is animating: let the thread sleep
+                # until input arrives instead of redrawing a static screen.
+                event = pygame.event.wait(33)
+                events = [] if event.type == pygame.NOEVENT else [event]
+                events += pygame.event.get(self._handled_events)
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type in self._repaint_events:
+                    # the window was exposed, restored or resized: repaint all of it
+                    self.mark_dirty()
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mx, my = event.pos
                     if self.selecting_character:
                         # Detect character selection
-                        self.draw_character_selection()  # ensure rects exist
                         for idx, rect in enumerate(self.character_rects):
                             if rect.collidepoint(mx, my):
                                 if idx == 0:
@@ -402,22 +653,28 @@ class PygameHangman:
                                 elif idx == 2:
                                     self.character_selected = 'witchy'
                                 self.selecting_character = False
+                                # drop the previous character's figures
+                                self._figure_cache.clear()
+                                self.mark_dirty()
                                 break
                     elif not self.in_round and self.start_button_rect.collidepoint(mx, my):
                         self.start_round()
-                    elif self.in_round and (self.check_win() or self.check_lose()) and self.restart_button_rect.collidepoint(mx, my):
+                    elif self.in_round and (self._won or self._lost) and self.restart_button_rect.collidepoint(mx, my):
                         # restart returns to character selection
                         self.in_round = False
                         self.chosen_word = ''
+                        self._won = False
+                        self._lost = False
                         self.character_selected = None
                         self.selecting_character = True
+                        self.mark_dirty()
                 elif event.type == pygame.KEYDOWN:
-                    if self.in_round and not (self.check_win() or self.check_lose()):
+                    if self.in_round and not (self._won or self._lost):
                         ch = event.unicode.upper()
-                        if ch and ch in string.ascii_uppercase and ch not in self.guessed and ch not in self.wrong_guesses:
+                        if len(ch) == 1 and 'A' <= ch <= 'Z' and ch not in self._tried:
                             present = self.reveal_letter(ch)
                             # If wrong and no parts remain, trigger lose actions
-                            if not present and self.check_lose():
+                            if not present and self._lost:
                                 # reveal word
                                 pass
                     else:
@@ -425,28 +682,38 @@ class PygameHangman:
                         if not self.in_round and not self.selecting_character and event.key in (pygame.K_SPACE, pygame.K_RETURN):
                             self.start_round()
 
+            # Start confetti on a win (and again once a burst has finished)
+            self.expire_confetti()
+            if self.in_round and self._won and self.confetti_end_time == 0:
+                self.spawn_confetti()
+            # Skip the frame entirely when nothing on screen changed
+            if not self._dirty and not self.confetti:
+                continue
+
             # Drawing
-            self.screen.fill((245,245,245))
-            self.draw_gallows()
-            # draw initial hangman parts (only those still visible)
-            if not self.selecting_character:
-                self.draw_hangman()
+            won = self._won
+            lost = self._lost
+            # background, gallows and the hangman parts still visible in one blit
+            if self.selecting_character:
+                self.screen.blit(self._bg, (0, 0))
+            else:
+                self.screen.blit(self.figure_layer(), (0, 0))
             # Draw underscores and revealed letters
             if self.in_round:
-                self.draw_underscores_and_letters()
+                self.draw_underscores_and_letters(won)
                 self.draw_graveyard()
             # Draw confetti if win
-            if self.check_win() and self.confetti_end_time == 0:
-                self.spawn_confetti()
-            self.update_confetti()
-            self.draw_confetti()
+            if self.confetti:
+                self.update_confetti()
+            if self.confetti:
+                self.draw_confetti()
 
             # Buttons and character selection
             self.draw_buttons()
 
             # Win/Lose messages
             # Draw win/lose popup with white background
-            if self.in_round and (self.check_lose() or self.check_win()):
+            if self.in_round and (lost or won):
                 # Popup rectangle
                 popup_w = 320
                 popup_h = 120
@@ -454,16 +721,18 @@ class PygameHangman:
                 popup_y = (self.HEIGHT - popup_h) // 2 - 20
                 pygame.draw.rect(self.screen, (255,255,255), (popup_x, popup_y, popup_w, popup_h))
                 pygame.draw.rect(self.screen, (0,0,0), (popup_x, popup_y, popup_w, popup_h), 2)
-                if self.check_lose():
-                    msg = self.big_font.render('You Lose!', True, (0,0,0))
+                if lost:
+                    msg = self._lose_text
                     self.screen.blit(msg, msg.get_rect(center=(self.WIDTH//2, self.HEIGHT//2 - 20)))
-                    reveal = self.font.render('Word: ' + self.chosen_word, True, (200,0,0))
+                    if self._reveal_text is None:
+                        self._reveal_text = self.font.render('Word: ' + self.chosen_word, True, (200,0,0)).convert_alpha()
+                    reveal = self._reveal_text
                     self.screen.blit(reveal, reveal.get_rect(center=(self.WIDTH//2, self.HEIGHT//2 + 20)))
-                elif self.check_win():
-                    msg = self.big_font.render('You Win!', True, (0,0,0))
+                elif won:
+                    msg = self._win_text
                     self.screen.blit(msg, msg.get_rect(center=(self.WIDTH//2, self.HEIGHT//2 - 20)))
 
-            pygame.display.flip()
+            self.present()
             self.clock.tick(30)
 
         pygame.quit()
@@ -22,6 +22,10 @@ import random
 import string
 import tkinter as tk
 from tkinter import messagebox
+from tkinter import font as tkfont
+
+# Letters accepted as guesses (set membership instead of scanning the string)
+_ALPHA = frozenset(string.ascii_uppercase)
 
 
 def find_wordlist():
@@ -60,6 +64,15 @@ class HangmanGame:
         self.canvas = tk.Canvas(root, width=self.width, height=self.height, bg='white')
         self.canvas.pack()
 
+        # Font objects are built once and shared by every text item
+        self.font_letter = tkfont.Font(root=root, family='Helvetica', size=16, weight='bold')
+        # start button text and graveyard letters share one 14pt bold font
+        self.font_bold = tkfont.Font(root=root, family='Helvetica', size=14, weight='bold')
+        self.font_label = tkfont.Font(root=root, family='Helvetica', size=12, weight='bold')
+        self.font_hint = tkfont.Font(root=root, family='Helvetica', size=10)
+        self.font_title = tkfont.Font(root=root, family='Helvetica', size=30, weight='bold')
+        self.font_reveal = tkfont.Font(root=root, family='Helvetica', size=20, weight='bold')
+
         # Load words
         self.word_list = find_wordlist()
         if not self.word_list:
@@ -71,10 +84,13 @@ class HangmanGame:
         # UI elements: use canvas-drawn buttons to avoid embedded-widget display issues
         self.start_button_ids = None  # (rect_id, text_id)
         self.restart_button_ids = None
+        self._pulse_job = None  # pending after() id of the start button pulse
 
         # Game state
         self.chosen_word = ''
         self.letters_positions = []  # list of text ids for letters above underscores
+        self._positions = {}  # letter -> indices in chosen_word
+        self._remaining = 0  # distinct letters not yet guessed
         self.underscore_positions = []  # list of line ids (for future use)
         self.guessed = set()
         self.wrong_guesses = []
@@ -83,7 +99,9 @@ class HangmanGame:
         self.parts_removal_order = []  # item ids in the order to remove
         self.game_over = False
 
-        # Bind keys
+        # Bind keys; guesses are queued and handled one per event-loop pass
+        self._pending_keys = []
+        self._keys_pending = False
         root.bind('<Key>', self.on_key_press)
         # Also bind Space and Enter to start the game as a fallback if the Start button is not visible
         root.bind('<space>', lambda e: self.start_game())
@@ -99,18 +117,20 @@ class HangmanGame:
         # Now create the Start button on top of the static drawing so it's visible
         self.create_start_button()
 
-        # Debug: list canvas items and check the start button bbox so we can diagnose visibility issues
-        try:
-            items = self.canvas.find_all()
-            print('Canvas items after init:', items)
-            start_items = self.canvas.find_withtag('start_btn')
-            print(' start_btn items:', start_items)
-            print(' start_btn bbox:', self.canvas.bbox('start_btn'))
-            # print each item's tags and coords
-            for it in items:
-                print('  item', it, 'tags=', self.canvas.gettags(it), 'coords=', self.canvas.coords(it))
-        except Exception:
-            pass
+        # Debug: list canvas items and check the start button bbox so we can diagnose visibility issues.
+        # Only when HANGMAN_DEBUG is set, since it queries and prints every canvas item on startup.
+        if os.environ.get('HANGMAN_DEBUG'):
+            try:
+                items = self.canvas.find_all()
+                print('Canvas items after init:', items)
+                start_items = self.canvas.find_withtag('start_btn')
+                print(' start_btn items:', start_items)
+                print(' start_btn bbox:', self.canvas.bbox('start_btn'))
+                # print each item's tags and coords
+                for it in items:
+                    print('  item', it, 'tags=', self.canvas.gettags(it), 'coords=', self.canvas.coords(it))
+            except Exception:
+                pass
 
         # Graveyard layout base coordinates
         self.grave_x = 60
@@ -166,28 +186,32 @@ class HangmanGame:
 
     # ----------------- Drawing helpers -----------------
     def draw_gallows(self):
-        """Draw the static parts of the gallows (base, post, beam, rope)."""
+        """Draw the static parts of the gallows (base, post, beam, rope).
+
+        These are tagged 'static' and drawn once; everything else on the canvas is
+        tagged 'dynamic' so a new round only has to delete('dynamic').
+        """
         # base
-        self.canvas.create_line(220, 460, 480, 460, width=6)
+        self.canvas.create_line(220, 460, 480, 460, width=6, tags='static')
         # vertical post
-        self.canvas.create_line(300, 460, 300, 120, width=6)
+        self.canvas.create_line(300, 460, 300, 120, width=6, tags='static')
         # top beam
-        self.canvas.create_line(300, 120, 420, 120, width=6)
+        self.canvas.create_line(300, 120, 420, 120, width=6, tags='static')
         # rope
-        self.canvas.create_line(420, 120, 420, 150, width=3)
+        self.canvas.create_line(420, 120, 420, 150, width=3, tags='static')
 
     def draw_full_hangman(self):
         """Draw the full stick-figure hangman; save parts so they can be removed later."""
         # Head
-        head = self.canvas.create_oval(400, 150, 440, 190, width=2, fill='')
+        head = self.canvas.create_oval(400, 150, 440, 190, width=2, fill='', tags=('hangman', 'dynamic'))
         # Body
-        body = self.canvas.create_line(420, 190, 420, 260, width=2)
+        body = self.canvas.create_line(420, 190, 420, 260, width=2, tags=('hangman', 'dynamic'))
         # Arms
-        left_arm = self.canvas.create_line(420, 210, 390, 230, width=2)
-        right_arm = self.canvas.create_line(420, 210, 450, 230, width=2)
+        left_arm = self.canvas.create_line(420, 210, 390, 230, width=2, tags=('hangman', 'dynamic'))
+        right_arm = self.canvas.create_line(420, 210, 450, 230, width=2, tags=('hangman', 'dynamic'))
         # Legs
-        left_leg = self.canvas.create_line(420, 260, 390, 300, width=2)
-        right_leg = self.canvas.create_line(420, 260, 450, 300, width=2)
+        left_leg = self.canvas.create_line(420, 260, 390, 300, width=2, tags=('hangman', 'dynamic'))
+        right_leg = self.canvas.create_line(420, 260, 450, 300, width=2, tags=('hangman', 'dynamic'))
 
         # Save parts and removal order. Removal order: left leg, right leg, left arm, right arm, body, head
         self.parts_ids = {
@@ -235,10 +259,10 @@ class HangmanGame:
             x1 = start_x + i * letter_spacing - 10
             x2 = start_x + i * letter_spacing + 10
             # underscore line
-            line = self.canvas.create_line(x1, self.word_y, x2, self.word_y, width=2)
+            line = self.canvas.create_line(x1, self.word_y, x2, self.word_y, width=2, tags='dynamic')
             self.underscore_positions.append(line)
             # placeholder for letter (above the underscore)
-            letter_id = self.canvas.create_text((x1+x2)//2, self.word_y-16, text='', font=('Helvetica', 16, 'bold'))
+            letter_id = self.canvas.create_text((x1+x2)//2, self.word_y-16, text='', font=self.font_letter, tags='dynamic')
             self.letters_positions.append(letter_id)
 
     # ----------------- Canvas button helpers -----------------
@@ -255,54 +279,47 @@ class HangmanGame:
         x = self.width // 2
         y = 80
 
-        rect = self.canvas.create_rectangle(x - w//2, y - h//2, x + w//2, y + h//2, fill='#4CAF50', outline='black', width=2, tags='start_btn')
-        text = self.canvas.create_text(x, y, text='Start', font=('Helvetica', 14, 'bold'), fill='white', tags='start_btn')
+        rect = self.canvas.create_rectangle(x - w//2, y - h//2, x + w//2, y + h//2, fill='#4CAF50', outline='black', width=2, tags=('start_btn', 'ui_overlay', 'dynamic'))
+        text = self.canvas.create_text(x, y, text='Start', font=self.font_bold, fill='white', tags=('start_btn', 'ui_overlay', 'dynamic'))
         # small hint text below the button to make it obvious
-        hint = self.canvas.create_text(x, y + h//1.5, text='Click Start to play', font=('Helvetica', 10), fill='gray20', tags='start_hint')
+        hint = self.canvas.create_text(x, y + h//1.5, text='Click Start to play', font=self.font_hint, fill='gray20', tags=('start_hint', 'ui_overlay', 'dynamic'))
 
         self.canvas.tag_bind('start_btn', '<Button-1>', lambda e: self.start_game())
-        # make sure the start button and hint are on top of other canvas items
-        try:
-            self.canvas.tag_raise('start_btn')
-            self.canvas.tag_raise('start_hint')
-        except Exception:
-            pass
+        # the button is created after the gallows and hangman, so it is already on top
         self.start_button_ids = (rect, text, hint)
 
         # brief pulse animation to draw attention: alternate fill a few times
-        def pulse(count=6):
-            if count <= 0:
-                try:
-                    self.canvas.itemconfigure(rect, fill='#4CAF50')
-                except Exception:
-                    pass
-                return
+        self.cancel_pulse()
+        self._pulse_tick()
+
+        # debug print bbox
+        if os.environ.get('HANGMAN_DEBUG'):
             try:
-                color = '#66BB6A' if count % 2 == 0 else '#388E3C'
-                self.canvas.itemconfigure(rect, fill=color)
+                print('created start_btn bbox:', self.canvas.bbox('start_btn'))
             except Exception:
                 pass
-            self.root.after(300, lambda: pulse(count-1))
-
-        try:
-            pulse()
-        except Exception:
-            pass
 
-        # Ensure the start button is on top (try twice: immediate and after a short delay)
-        try:
-            self.canvas.tag_raise('start_btn')
-            self.canvas.tag_raise('start_hint')
-            # also schedule another raise after widgets have been drawn
-            self.root.after(80, lambda: (self.canvas.tag_raise('start_btn'), self.canvas.tag_raise('start_hint')))
-        except Exception:
-            pass
+    def _pulse_tick(self, count=6):
+        """Advance the start button pulse by one step; stops once the button is gone."""
+        self._pulse_job = None
+        if self.start_button_ids is None:
+            return
+        rect = self.start_button_ids[0]
+        if count <= 0:
+            self.canvas.itemconfigure(rect, fill='#4CAF50')
+            return
+        color = '#66BB6A' if count % 2 == 0 else '#388E3C'
+        self.canvas.itemconfigure(rect, fill=color)
+        self._pulse_job = self.root.after(300, self._pulse_tick, count-1)
 
-        # debug print bbox
-        try:
-            print('created start_btn bbox:', self.canvas.bbox('start_btn'))
-        except Exception:
-            pass
+    def cancel_pulse(self):
+        """Cancel a pending start button pulse step, if any."""
+        if self._pulse_job is not None:
+            try:
+                self.root.after_cancel(self._pulse_job)
+            except Exception:
+                pass
+            self._pulse_job = None
 
     def create_restart_button(self):
         """Create a Restart button using canvas shapes at top-center and bind click."""
@@ -311,8 +328,8 @@ class HangmanGame:
         h = 30
         x = self.width // 2
         y = 50
-        rect = self.canvas.create_rectangle(x - w//2, y - h//2, x + w//2, y + h//2, fill='#2196F3', outline='black', tags='restart_btn')
-        text = self.canvas.create_text(x, y, text='Restart', font=('Helvetica', 12, 'bold'), fill='white', tags='restart_btn')
+        rect = self.canvas.create_rectangle(x - w//2, y - h//2, x + w//2, y + h//2, fill='#2196F3', outline='black', tags=('restart_btn', 'ui_overlay', 'dynamic'))
+        text = self.canvas.create_text(x, y, text='Restart', font=self.font_label, fill='white', tags=('restart_btn', 'ui_overlay', 'dynamic'))
         self.canvas.tag_bind('restart_btn', '<Button-1>', lambda e: self.restart())
         try:
             self.canvas.tag_raise('restart_btn')
@@ -343,28 +360,20 @@ class HangmanGame:
                 self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg='white')
                 # remove any previous packing and pack new canvas
                 self.canvas.pack()
+                self.draw_gallows()
             except Exception as e:
                 print('Failed to recreate canvas:', e)
 
         # Safely remove start button (erase it) and ensure restart button is removed.
         # Delete the canvas window first so the button visibly disappears even if widget.destroy() raises.
         # Debug visibility: print when start_game is invoked and remove any canvas buttons
-        print('start_game() called')
-        print('  removing canvas start_btn and restart_btn (if present)')
-        # remove canvas-drawn start/restart buttons (preferred)
-        try:
-            self.canvas.delete('start_btn')
-        except Exception:
-            pass
-        try:
-            self.canvas.delete('start_hint')
-        except Exception:
-            pass
+        if os.environ.get('HANGMAN_DEBUG'):
+            print('start_game() called')
+            print('  removing canvas start_btn and restart_btn (if present)')
+        # remove canvas-drawn start/restart buttons (preferred); they share the 'ui_overlay' tag
+        self.canvas.delete('ui_overlay')
         self.start_button_ids = None
-        try:
-            self.canvas.delete('restart_btn')
-        except Exception:
-            pass
+        self.cancel_pulse()
         self.restart_button_ids = None
 
         # Also defensively remove any legacy widget-based buttons if they exist
@@ -381,56 +390,41 @@ class HangmanGame:
                 pass
             self.start_window = None
 
-        # Force the canvas to update immediately so the UI reflects removal
-        try:
-            self.canvas.update_idletasks()
-            print('  canvas update_idletasks called')
-        except Exception:
-            pass
-
         self.game_over = False
         self.guessed = set()
         self.wrong_guesses = []
+        self._pending_keys = []
 
         # choose a random word
         self.chosen_word = random.choice(self.word_list).upper()
-        print('chosen word:', self.chosen_word)
-
-        # reset hangman: if some parts are missing, redraw everything: remove old parts and redraw all
-        for item in list(self.parts_ids.values()):
-            try:
-                self.canvas.delete(item)
-            except Exception:
-                pass
-
-        # draw gallows and full hangman again
-        self.canvas.delete('all')
-        self.draw_gallows()
+        self._positions = {}
+        for i, c in enumerate(self.chosen_word):
+            self._positions.setdefault(c, []).append(i)
+        self._remaining = len(self._positions)
+        if os.environ.get('HANGMAN_DEBUG'):
+            print('chosen word:', self.chosen_word)
+
+        # reset hangman: clear everything but the static gallows and redraw the full figure
+        self.canvas.delete('dynamic')
         self.draw_full_hangman()
 
         # redraw graveyard area label
-        self.canvas.create_text(self.grave_x, self.grave_y - 30, text='Graveyard', font=('Helvetica', 12, 'bold'))
+        self.canvas.create_text(self.grave_x, self.grave_y - 30, text='Graveyard', font=self.font_label, tags='dynamic')
 
         # draw underscores for chosen word
         self.draw_underscores()
-        try:
+        if os.environ.get('HANGMAN_DEBUG'):
             print('underscores created, letter count:', len(self.letters_positions), 'ids=', self.letters_positions)
-        except Exception:
-            pass
 
-        # Ensure the main window and canvas are visible and updated
-        try:
-            self.canvas.update_idletasks()
-            self.canvas.update()
-        except Exception:
-            pass
+        # Tk repaints once this handler returns to the event loop
         try:
             # bring main window to front in case a dialog was covering it
             self.root.lift()
             self.root.focus_force()
-            print('drew gallows and underscores; window lifted and focused')
         except Exception:
             pass
+        if os.environ.get('HANGMAN_DEBUG'):
+            print('drew gallows and underscores; window lifted and focused')
 
         # reset parts removal order in case it's been modified
         self.parts_removal_order = [
@@ -457,12 +451,9 @@ class HangmanGame:
         for idx, ch in enumerate(self.wrong_guesses):
             x = self.grave_x
             y = self.grave_y + idx * self.grave_spacing
-            self.canvas.create_text(x, y, text=ch, fill='red', font=('Helvetica', 14, 'bold'), tag='grave')
-        try:
-            self.canvas.update_idletasks()
+            self.canvas.create_text(x, y, text=ch, fill='red', font=self.font_bold, tags=('grave', 'dynamic'))
+        if os.environ.get('HANGMAN_DEBUG'):
             print('graveyard drawn, wrong guesses:', self.wrong_guesses)
-        except Exception:
-            pass
 
     def on_key_press(self, event):
         """Handle key press events for guessing letters. Ignores non-alpha and if game not running."""
@@ -470,20 +461,49 @@ class HangmanGame:
             return
         if not self.chosen_word:
             return
-        ch = event.char.upper()
-        if not ch or ch not in string.ascii_uppercase:
+        ch = event.char
+        if len(ch) != 1:
+            return
+        # common case: a lowercase ASCII letter, uppercased without calling str.upper()
+        o = ord(ch)
+        if 97 <= o <= 122:
+            ch = chr(o - 32)
+        elif ch not in _ALPHA:
+            return
+        if ch in self.guessed or ch in self._pending_keys:
             return
+        # key autorepeat can outpace redraws: queue the key and handle it when idle
+        self._pending_keys.append(ch)
+        if not self._keys_pending:
+            self._keys_pending = True
+            self.root.after_idle(self._drain_keys)
+
+    def _drain_keys(self):
+        """Handle one queued guess; any further keys wait for the next idle pass."""
+        self._keys_pending = False
+        if not self._pending_keys:
+            return
+        ch = self._pending_keys.pop(0)
+        if not self.game_over and self.chosen_word:
+            self.guess_letter(ch)
+        if self._pending_keys:
+            self._keys_pending = True
+            self.root.after_idle(self._drain_keys)
+
+    def guess_letter(self, ch):
+        """Apply a single uppercase letter guess: reveal it or count it as wrong."""
         if ch in self.guessed:
             return
         self.guessed.add(ch)
 
-        if ch in self.chosen_word:
+        positions = self._positions.get(ch)
+        if positions:
             # reveal all positions of this letter
-            for i, letter in enumerate(self.chosen_word):
-                if letter == ch:
-                    self.canvas.itemconfigure(self.letters_positions[i], text=ch, fill='green')
+            for i in positions:
+                self.canvas.itemconfigure(self.letters_positions[i], text=ch, fill='green')
             # check win
-            if all(self.canvas.itemcget(tid, 'text') != '' for tid in self.letters_positions):
+            self._remaining -= 1
+            if self._remaining == 0:
                 self.win()
         else:
             # wrong guess
@@ -512,10 +532,10 @@ class HangmanGame:
         """Handle losing the game: show message and reveal the word; provide restart button."""
         self.game_over = True
         # big "You lose!" message
-        self.canvas.create_text(self.width//2, self.height//2 - 20, text='You Lose!', font=('Helvetica', 30, 'bold'), fill='black', tag='endmsg')
+        self.canvas.create_text(self.width//2, self.height//2 - 20, text='You Lose!', font=self.font_title, fill='black', tags=('endmsg', 'ui_overlay', 'dynamic'))
         # reveal correct word below in red
         reveal_text = 'Word: ' + self.chosen_word
-        self.canvas.create_text(self.width//2, self.height//2 + 20, text=reveal_text, font=('Helvetica', 20, 'bold'), fill='red', tag='endmsg')
+        self.canvas.create_text(self.width//2, self.height//2 + 20, text=reveal_text, font=self.font_reveal, fill='red', tags=('endmsg', 'ui_overlay', 'dynamic'))
         # show restart button
         self.show_restart()
 
@@ -526,7 +546,7 @@ class HangmanGame:
         for tid in self.letters_positions:
             self.canvas.itemconfigure(tid, fill='#66ff66')
 
-        self.canvas.create_text(self.width//2, self.height//2 - 20, text='You Win!', font=('Helvetica', 30, 'bold'), fill='black', tag='endmsg')
+        self.canvas.create_text(self.width//2, self.height//2 - 20, text='You Win!', font=self.font_title, fill='black', tags=('endmsg', 'ui_overlay', 'dynamic'))
 
         # start confetti
         self.start_confetti(duration=3000)
@@ -543,25 +563,18 @@ class HangmanGame:
 
     def restart(self):
         """Restart the game: clear overlays and show the start button again (or start immediately)."""
-        # remove any end messages and confetti
-        self.canvas.delete('endmsg')
-        self.canvas.delete('confetti')
-        # remove any canvas restart button
-        try:
-            self.canvas.delete('restart_btn')
-        except Exception:
-            pass
+        # end messages, confetti and the restart button all go with delete('dynamic') below
         self.restart_button_ids = None
 
         # Reset state
         self.chosen_word = ''
         self.guessed = set()
         self.wrong_guesses = []
+        self._pending_keys = []
         self.game_over = False
 
-        # clear canvas and redraw static gallows and fresh hangman
-        self.canvas.delete('all')
-        self.draw_gallows()
+        # clear everything but the static gallows and draw a fresh hangman
+        self.canvas.delete('dynamic')
         self.draw_full_hangman()
 
         # recreate start button in the cleared canvas
@@ -570,12 +583,7 @@ class HangmanGame:
     # ----------------- Confetti -----------------
     def start_confetti(self, duration=3000):
         """Launch confetti pieces that fall from the top for 'duration' milliseconds."""
-        end_time = self.root.after(duration, lambda: None)
         # spawn many little rectangles/ovals with random colors and animate them falling
-        import time
-        start_t = self.root.winfo_toplevel().tk.call('clock', 'milliseconds')
-
-        # create a lot of confetti pieces
         pieces = []
         colors = ['#ff4d4d', '#4dff4d', '#4d4dff', '#ffff4d', '#ff4dff', '#4dffff']
         for i in range(60):
@@ -583,22 +591,23 @@ class HangmanGame:
             y = random.randint(-80, -10)
             size = random.randint(4, 8)
             color = random.choice(colors)
-            pid = self.canvas.create_oval(x, y, x+size, y+size, fill=color, outline='', tag='confetti')
+            pid = self.canvas.create_oval(x, y, x+size, y+size, fill=color, outline='', tags=('confetti', 'dynamic'))
             vx = random.uniform(-1.5, 1.5)
             vy = random.uniform(2, 5)
             pieces.append((pid, vx, vy))
 
         def animate():
-            # move each piece; if below screen remove it
-            for i, (pid, vx, vy) in enumerate(pieces[:]):
-                try:
-                    self.canvas.move(pid, vx, vy)
-                    coords = self.canvas.coords(pid)
-                    if coords and coords[1] > self.height + 20:
-                        self.canvas.delete(pid)
-                        pieces.remove((pid, vx, vy))
-                except Exception:
-                    pass
+            # move each piece and keep the ones still on screen in a single pass
+            alive = []
+            for pid, vx, vy in pieces:
+                self.canvas.move(pid, vx, vy)
+                coords = self.canvas.coords(pid)
+                # no coords: the piece was already deleted (e.g. by restart)
+                if not coords or coords[1] > self.height + 20:
+                    self.canvas.delete(pid)
+                else:
+                    alive.append((pid, vx, vy))
+            pieces[:] = alive
             if pieces:
                 self.root.after(33, animate)
 
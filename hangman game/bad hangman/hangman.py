@@ -20,15 +20,22 @@ This file is standalone and uses only the Python standard library (tkinter).
 import random
 import sys
 import os
-import math
+import pickle
+import time
 import traceback
 import tkinter as tk
 from tkinter import messagebox
+from tkinter import font as tkfont
 
 # ----- Configuration -----
 CANVAS_W = 500
 CANVAS_H = 500
 WORDS_FILE = 'random_common_words_20000.txt'
+# Parsed word list, reused while the words file is unchanged (size + mtime)
+WORDS_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'hangman_words.pkl')
+WORDS_CACHE_VERSION = 2  # bump when the cached format changes
+# Used when the words file is missing or has no usable words
+FALLBACK_WORDS = ('python', 'hangman', 'canvas', 'example', 'testing')
 
 # Colors
 COLOR_GALLOWS = '#444444'
@@ -41,6 +48,13 @@ COLOR_WRONG = '#EF4444'    # red
 # The order in which parts will be removed on wrong guesses (first removed = left leg)
 PARTS_ORDER = ['left_leg', 'right_leg', 'left_arm', 'right_arm', 'body', 'head']
 
+# Confetti frame delay (ms): nominal and backed-off when frames arrive late; motion is tuned for the nominal one
+CONFETTI_FRAME_MS = 33
+CONFETTI_SLOW_MS = 50
+
+# Parts of the scene that render() can bring up to date (the gallows never change)
+RENDER_LAYERS = ('hangman', 'graveyard', 'word', 'overlay', 'banner')
+
 
 class HangmanGame:
     """Main game class managing state, drawing and input."""
@@ -60,33 +74,61 @@ class HangmanGame:
         # allow clicking the canvas to focus it (so keyboard input will be received)
         self.canvas.bind('<Button-1>', lambda e: self.canvas.focus_set())
 
+        # diagnostic prints; off unless HANGMAN_DEBUG is set
+        self.verbose = bool(os.environ.get('HANGMAN_DEBUG'))
+
         # Load words from the provided file (fallback to small default list)
         self.words = self.load_words(WORDS_FILE)
-        print(f'Loaded {len(self.words)} words (sample: {self.words[0] if self.words else "<none>"})')
+        if self.verbose:
+            print(f'Loaded {len(self.words)} words (sample: {self.words[0] if self.words else "<none>"})')
 
         # Game state
         self.current_word = ''
         self.revealed = []  # booleans per letter
+        # letter -> indices in current_word, and how many distinct letters are still hidden
+        self._positions = {}
+        self._remaining = 0
         self.wrong_letters = []
-        # parts_present maps part name to boolean (True = visible)
-        self.parts_present = {p: True for p in PARTS_ORDER}
+        # index into PARTS_ORDER of the next part to remove; parts before it are gone
+        self._next_part_idx = 0
         self.game_active = False
 
-        # confetti particles (on win)
+        # confetti particles (on win): canvas ids plus parallel y / velocity lists
         self.confetti = []
+        self._confetti_y = []
+        self._confetti_vx = []
+        self._confetti_vy = []
         self.confetti_job = None
+        self._confetti_delay = CONFETTI_FRAME_MS
+        self._confetti_last = None  # perf_counter() of the previous animated frame
 
-        # keyboard binding
+        # keyboard binding; guesses are queued and handled one per event-loop pass
+        self._pending_keys = []
+        self._keys_pending = False
         root.bind('<Key>', self.on_key)
 
+        # Create every canvas item once; render() then only reconfigures the
+        # layers that changed instead of deleting and recreating the scene
+        self._dirty = set(RENDER_LAYERS)
+        self._redraw_pending = False
+        # Font objects are built once and shared by every text item
+        self.font_wrong = tkfont.Font(root=root, family='Monospace', size=14, weight='bold')
+        self.font_letter = tkfont.Font(root=root, family='Monospace', size=20, weight='bold')
+        self.font_reveal = tkfont.Font(root=root, family='Monospace', size=16)
+        self.font_title = tkfont.Font(root=root, family='Sans', size=28, weight='bold')
+        self.font_banner = tkfont.Font(root=root, family='Sans', size=12, weight='bold')
+        self.build_scene()
+
         # initial render
         self.render()
 
     # ----------------- Word loading -----------------
     def load_words(self, path):
-        """Load words from the given path. Returns a list of words.
+        """Load words from the given path. Returns a tuple of lowercase, letters-only words.
 
-        If the file is missing or empty, returns a small fallback list.
+        Words are validated here once so start_round can pick without retrying.
+        If the file is missing or has no usable words, returns FALLBACK_WORDS. The
+        parsed tuple is pickled to WORDS_CACHE so later starts skip parsing the file.
         """
         try:
             base = os.path.dirname(__file__)
@@ -95,44 +137,63 @@ class HangmanGame:
         p = os.path.join(base, path)
         if not os.path.exists(p):
             print(f"Warning: {path} not found — using fallback word list.")
-            return ['python', 'hangman', 'canvas', 'example', 'testing']
+            return FALLBACK_WORDS
+
+        st = os.stat(p)
+        key = (WORDS_CACHE_VERSION, os.path.abspath(p), st.st_size, st.st_mtime_ns)
+        try:
+            with open(WORDS_CACHE, 'rb') as f:
+                cached_key, words = pickle.load(f)
+            if cached_key == key and words:
+                return words
+        except Exception:
+            pass
 
+        # one read plus C-level lower/split/filter instead of a Python loop per line
         with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = [l.strip() for l in f if l.strip()]
-        if not lines:
-            return ['python', 'hangman', 'canvas', 'example', 'testing']
-        return lines
+            words = tuple(filter(str.isalpha, f.read().lower().split()))
+        if not words:
+            return FALLBACK_WORDS
+        try:
+            os.makedirs(os.path.dirname(WORDS_CACHE), exist_ok=True)
+            with open(WORDS_CACHE, 'wb') as f:
+                pickle.dump((key, words), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print('Could not write word cache:', repr(e))
+        return words
 
     # ----------------- Game flow -----------------
     def start_round(self):
         """Begin a new round: pick a random word and reset state."""
-        # pick and log the chosen word (diagnostics)
-        self.current_word = random.choice(self.words).strip()
-        print(f'Picked raw word: "{self.current_word}"')
-        # guard: ensure word is alphabetical; if not pick again a few times
-        attempts = 0
-        while attempts < 10 and not self.current_word.isalpha():
-            self.current_word = random.choice(self.words).strip()
-            attempts += 1
-
-        # normalize
-        self.current_word = self.current_word.lower()
+        # pick and log the chosen word (diagnostics); load_words already left only
+        # lowercase letters-only words, so no retry or normalizing is needed
+        self.current_word = random.choice(self.words)
+        if self.verbose:
+            print(f'Picked word: "{self.current_word}"')
         self.revealed = [False] * len(self.current_word)
+        self._positions = {}
+        for i, c in enumerate(self.current_word):
+            self._positions.setdefault(c, []).append(i)
+        self._remaining = len(self._positions)
         self.wrong_letters = []
-        self.parts_present = {p: True for p in PARTS_ORDER}
+        self._next_part_idx = 0
         self.game_active = True
+        self._pending_keys = []
         self.stop_confetti()
+        self.mark_dirty()
         # ensure keyboard events go to the canvas so the player can type guesses
         try:
             self.canvas.focus_set()
         except Exception:
             pass
-        print(f'After init: current_word="{self.current_word}", revealed_len={len(self.revealed)}, wrong_letters={self.wrong_letters}, parts_present={self.parts_present}')
-        self.render()
+        if self.verbose:
+            print(f'After init: current_word="{self.current_word}", revealed_len={len(self.revealed)}, wrong_letters={self.wrong_letters}, parts_removed={self._next_part_idx}')
+        self._schedule_redraw()
 
     def _on_start_button(self):
         """Wrapper called by the Start button. Logs the click and reports errors if any occur."""
-        print('Start button clicked')
+        if self.verbose:
+            print('Start button clicked')
         try:
             self.start_round()
         except Exception as e:
@@ -149,36 +210,53 @@ class HangmanGame:
         ch = event.char.lower()
         if not ch or not ch.isalpha() or len(ch) != 1:
             return
-        self.handle_guess(ch)
+        # key autorepeat can outpace redraws: queue the key (once) and handle it when idle
+        if ch in self._pending_keys:
+            return
+        self._pending_keys.append(ch)
+        if not self._keys_pending:
+            self._keys_pending = True
+            self.root.after_idle(self._drain_keys)
+
+    def _drain_keys(self):
+        """Handle one queued guess; any further keys wait for the next idle pass."""
+        self._keys_pending = False
+        if not self._pending_keys:
+            return
+        ch = self._pending_keys.pop(0)
+        if self.game_active:
+            self.handle_guess(ch)
+        if self._pending_keys:
+            self._keys_pending = True
+            self.root.after_idle(self._drain_keys)
 
     def handle_guess(self, ch):
         """Process a single-letter guess."""
         if ch in self.wrong_letters:
             return
-        lower = self.current_word
-        any_reveal = False
-        for i, c in enumerate(lower):
-            if c == ch and not self.revealed[i]:
+        positions = self._positions.get(ch)
+        # a letter is revealed all at once, so checking its first position is enough
+        if positions and not self.revealed[positions[0]]:
+            for i in positions:
                 self.revealed[i] = True
-                any_reveal = True
-
-        if any_reveal:
+            self._remaining -= 1
+            self.mark_dirty('word', 'banner')
             # check for win
-            if all(self.revealed):
+            if self._remaining == 0:
                 self.win()
         else:
+            self.mark_dirty('graveyard', 'banner')
             # wrong guess
             self.wrong_letters.append(ch)
             # remove next part in the configured order
-            for p in PARTS_ORDER:
-                if self.parts_present.get(p, False):
-                    self.parts_present[p] = False
-                    break
+            idx = self._next_part_idx
+            self.canvas.itemconfigure(self.part_ids[PARTS_ORDER[idx]], state='hidden')
+            self._next_part_idx = idx + 1
             # if all parts removed -> lose
-            if not any(self.parts_present.values()):
+            if self._next_part_idx == len(PARTS_ORDER):
                 self.lose()
 
-        self.render()
+        self._schedule_redraw()
 
     def win(self):
         """Handle win state: stop active play and play confetti."""
@@ -186,6 +264,7 @@ class HangmanGame:
         # reveal all to show the lighter-green effect (render handles colors)
         for i in range(len(self.revealed)):
             self.revealed[i] = True
+        self.mark_dirty('word', 'overlay', 'banner')
         self.start_confetti(3000)
 
     def lose(self):
@@ -193,162 +272,231 @@ class HangmanGame:
         self.game_active = False
         for i in range(len(self.revealed)):
             self.revealed[i] = True
+        self.mark_dirty('word', 'overlay', 'banner')
 
     # ----------------- Drawing helpers -----------------
-    def render(self):
-        """Clear and redraw entire canvas and UI elements."""
-        print('render() called — redrawing canvas')
-        # Clear everything and redraw. Avoid querying canvas internals (find_all/bbox)
-        # which can raise if the widget is in a transient state. Instead, log which
-        # draw helpers run so we can see which elements are being created.
-        try:
-            self.canvas.delete('all')
-        except Exception as e:
-            print('Canvas delete error:', repr(e))
-            return
-
-        self.draw_gallows()
-        self.draw_hangman()
-        self.draw_graveyard()
-        self.draw_word_display()
-        self.draw_overlay()
-        # On-canvas debug banner so we can visually confirm the canvas is rendering.
-        try:
-            state_text = f'Word="{self.current_word}" revealed={sum(1 for r in self.revealed if r)}/{len(self.revealed) if self.revealed else 0} wrong={len(self.wrong_letters)}'
-            # Draw a simple background rectangle for readability
-            self.canvas.create_rectangle(6, 6, CANVAS_W-6, 36, fill='#ffffff', outline='#111111', width=1)
-            self.canvas.create_text(CANVAS_W/2, 20, text=state_text, fill='#111111', font=('Sans', 12, 'bold'))
-        except Exception as e:
-            print('Debug banner error:', repr(e))
+    def build_scene(self):
+        """Create the persistent canvas items: gallows, hangman parts, graveyard, overlay and banner.
 
-        # If confetti particles exist, draw them directly (confetti animation
-        # steps draw confetti without calling render to avoid re-entrancy).
-        if self.confetti:
-            try:
-                for p in self.confetti:
-                    x = p['x']; y = p['y']; r = p['r']
-                    self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=p['color'], outline='', tags='confetti')
-            except Exception as e:
-                print('Error drawing confetti in render:', repr(e))
-
-    def draw_gallows(self):
-        print('draw_gallows()')
+        Word-strip items are created on demand by _ensure_word_slots since their
+        count depends on the word length.
+        """
         c = self.canvas
-        # base (thicker)
-        c.create_line(40, 460, 220, 460, width=10, fill=COLOR_GALLOWS)
-        # vertical post
-        c.create_line(120, 460, 120, 80, width=10, fill=COLOR_GALLOWS)
-        # top beam
-        c.create_line(120, 80, 340, 80, width=10, fill=COLOR_GALLOWS)
-        # rope
-        c.create_line(340, 80, 340, 140, width=6, fill=COLOR_GALLOWS)
+        # base (thicker), vertical post, top beam, rope
+        self.gallows_ids = [
+            c.create_line(40, 460, 220, 460, width=10, fill=COLOR_GALLOWS),
+            c.create_line(120, 460, 120, 80, width=10, fill=COLOR_GALLOWS),
+            c.create_line(120, 80, 340, 80, width=10, fill=COLOR_GALLOWS),
+            c.create_line(340, 80, 340, 140, width=6, fill=COLOR_GALLOWS),
+        ]
 
-    def draw_hangman(self):
-        print('draw_hangman()')
-        c = self.canvas
-        hp = self.parts_present
         headX = 340; headY = 170; headR = 24
         bodyTop = headY + headR; bodyBottom = bodyTop + 90
         armY = headY + 36
+        self.part_ids = {
+            'head': c.create_oval(headX-headR, headY-headR, headX+headR, headY+headR, width=4, outline=COLOR_HANGMAN),
+            # body (thicker)
+            'body': c.create_line(headX, bodyTop, headX, bodyBottom, width=6, fill=COLOR_HANGMAN),
+            'left_arm': c.create_line(headX, armY, headX-40, armY+28, width=5, fill=COLOR_HANGMAN),
+            'right_arm': c.create_line(headX, armY, headX+40, armY+28, width=5, fill=COLOR_HANGMAN),
+            'left_leg': c.create_line(headX, bodyBottom, headX-30, bodyBottom+60, width=5, fill=COLOR_HANGMAN),
+            'right_leg': c.create_line(headX, bodyBottom, headX+30, bodyBottom+60, width=5, fill=COLOR_HANGMAN),
+        }
+
+        # graveyard label plus one slot per possible wrong guess
+        x = 10; y = 150
+        c.create_text(x, y-20, anchor='nw', text='Wrong:', fill=COLOR_WRONG, font=self.font_wrong)
+        self.grave_ids = [
+            c.create_text(x, y + i*24, anchor='nw', text='', fill=COLOR_WRONG, font=self.font_wrong)
+            for i in range(len(PARTS_ORDER))
+        ]
+
+        # word strip: one underscore plus one letter per position
+        self.underscore_ids = []
+        self.letter_ids = []
+
+        # win/lose overlay, hidden until the round ends
+        self.overlay_ids = (
+            c.create_text(CANVAS_W/2, CANVAS_H/2 - 10, text='', font=self.font_title, state='hidden'),
+            c.create_text(CANVAS_W/2, CANVAS_H/2 + 24, text='', fill=COLOR_WRONG, font=self.font_reveal, state='hidden'),
+        )
 
-        # head
-        if hp.get('head', False):
-            c.create_oval(headX-headR, headY-headR, headX+headR, headY+headR, width=4, outline=COLOR_HANGMAN)
+        # On-canvas debug banner so we can visually confirm the canvas is rendering.
+        self.banner_ids = (
+            c.create_rectangle(6, 6, CANVAS_W-6, 36, fill='#ffffff', outline='#111111', width=1),
+            c.create_text(CANVAS_W/2, 20, text='', fill='#111111', font=self.font_banner),
+        )
 
-        # body (thicker)
-        if hp.get('body', False):
-            c.create_line(headX, bodyTop, headX, bodyBottom, width=6, fill=COLOR_HANGMAN)
+    def _ensure_word_slots(self, n):
+        """Make sure at least n underscore/letter item slots exist (the pool only grows)."""
+        c = self.canvas
+        while len(self.underscore_ids) < n:
+            self.underscore_ids.append(c.create_line(0, 0, 0, 0, fill=COLOR_UNDERSCORE, width=3, state='hidden'))
+            self.letter_ids.append(c.create_text(0, 0, text='', font=self.font_letter, state='hidden'))
 
-        # left arm
-        if hp.get('left_arm', False):
-            c.create_line(headX, armY, headX-40, armY+28, width=5, fill=COLOR_HANGMAN)
+    def mark_dirty(self, *layers):
+        """Flag layers (default: all of them) to be brought up to date by the next render()."""
+        self._dirty.update(layers or RENDER_LAYERS)
+
+    def _schedule_redraw(self):
+        """Request a render once control returns to the event loop.
+
+        Several state changes within one handler collapse into a single render.
+        """
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
 
-        # right arm
-        if hp.get('right_arm', False):
-            c.create_line(headX, armY, headX+40, armY+28, width=5, fill=COLOR_HANGMAN)
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.render()
 
-        # left leg
-        if hp.get('left_leg', False):
-            c.create_line(headX, bodyBottom, headX-30, bodyBottom+60, width=5, fill=COLOR_HANGMAN)
+    def render(self):
+        """Update the canvas items of every dirty layer; untouched layers are left as they are."""
+        dirty = self._dirty
+        if 'hangman' in dirty:
+            self.draw_hangman()
+        if 'graveyard' in dirty:
+            self.draw_graveyard()
+        if 'word' in dirty:
+            self.draw_word_display()
+        if 'overlay' in dirty:
+            self.draw_overlay()
+        if 'banner' in dirty:
+            try:
+                state_text = f'Word="{self.current_word}" revealed={sum(1 for r in self.revealed if r)}/{len(self.revealed) if self.revealed else 0} wrong={len(self.wrong_letters)}'
+                self.canvas.itemconfigure(self.banner_ids[1], text=state_text)
+            except Exception as e:
+                print('Debug banner error:', repr(e))
+        dirty.clear()
 
-        # right leg
-        if hp.get('right_leg', False):
-            c.create_line(headX, bodyBottom, headX+30, bodyBottom+60, width=5, fill=COLOR_HANGMAN)
+    def draw_hangman(self):
+        c = self.canvas
+        removed = self._next_part_idx
+        for idx, part in enumerate(PARTS_ORDER):
+            c.itemconfigure(self.part_ids[part], state='hidden' if idx < removed else 'normal')
 
     def draw_graveyard(self):
-        print('draw_graveyard()')
         c = self.canvas
-        x = 10; y = 150
-        c.create_text(x, y-20, anchor='nw', text='Wrong:', fill=COLOR_WRONG, font=('Monospace', 14, 'bold'))
-        for i, ch in enumerate(self.wrong_letters):
-            c.create_text(x, y + i*24, anchor='nw', text=ch.upper(), fill=COLOR_WRONG, font=('Monospace', 14, 'bold'))
+        for i, tid in enumerate(self.grave_ids):
+            c.itemconfigure(tid, text=self.wrong_letters[i].upper() if i < len(self.wrong_letters) else '')
 
     def draw_word_display(self):
-        print('draw_word_display()')
         c = self.canvas
         word = self.current_word.upper()
         n = len(word)
-        if n == 0:
-            return
-
-        area_left = 30
-        area_right = CANVAS_W - 30
-        area_width = area_right - area_left
-        spacing = min(40, max(20, area_width // n))
-        start_x = area_left + (area_width - spacing*n)/2 + spacing/2
-        y_underscore = 380
-
-        for i, ch in enumerate(word):
+        self._ensure_word_slots(n)
+
+        if n:
+            area_left = 30
+            area_right = CANVAS_W - 30
+            area_width = area_right - area_left
+            spacing = min(40, max(20, area_width // n))
+            start_x = area_left + (area_width - spacing*n)/2 + spacing/2
+            y_underscore = 380
+            # if game_active False and win occured, show lighter green
+            color = COLOR_CORRECT if self.game_active else (COLOR_CORRECT_LIGHT if all(self.revealed) else COLOR_CORRECT)
+
+        for i in range(len(self.underscore_ids)):
+            uid = self.underscore_ids[i]
+            lid = self.letter_ids[i]
+            if i >= n:
+                c.itemconfigure(uid, state='hidden')
+                c.itemconfigure(lid, state='hidden')
+                continue
             x = start_x + i*spacing
             # underscore (bigger)
-            c.create_line(x-16, y_underscore, x+16, y_underscore, fill=COLOR_UNDERSCORE, width=3)
+            c.coords(uid, x-16, y_underscore, x+16, y_underscore)
+            c.itemconfigure(uid, state='normal')
             # revealed letters
             if self.revealed[i]:
-                # if game_active False and win occured, show lighter green
-                color = COLOR_CORRECT if self.game_active else (COLOR_CORRECT_LIGHT if all(self.revealed) else COLOR_CORRECT)
-                c.create_text(x, y_underscore - 18, text=ch, fill=color, font=('Monospace', 20, 'bold'))
-                c.create_text(x, y_underscore - 10, text=ch, fill=color, font=('Monospace', 16))
+                c.coords(lid, x, y_underscore - 18)
+                c.itemconfigure(lid, text=word[i], fill=color, state='normal')
+            else:
+                c.itemconfigure(lid, state='hidden')
 
     def draw_overlay(self):
-        print('draw_overlay()')
         c = self.canvas
+        title_id, word_id = self.overlay_ids
         if not self.game_active and self.current_word:
             won = all(self.revealed)
             if won:
-                c.create_text(CANVAS_W/2, CANVAS_H/2 - 10, text='You Win!', fill='#047857', font=('Sans', 28, 'bold'))
+                c.itemconfigure(title_id, text='You Win!', fill='#047857', state='normal')
+                c.itemconfigure(word_id, state='hidden')
             else:
-                c.create_text(CANVAS_W/2, CANVAS_H/2 - 10, text='You Lose!', fill=COLOR_WRONG, font=('Sans', 28, 'bold'))
+                c.itemconfigure(title_id, text='You Lose!', fill=COLOR_WRONG, state='normal')
                 # reveal word in red below
-                c.create_text(CANVAS_W/2, CANVAS_H/2 + 24, text='Word: ' + self.current_word.upper(), fill=COLOR_WRONG, font=('Monospace', 16))
+                c.itemconfigure(word_id, text='Word: ' + self.current_word.upper(), state='normal')
+        else:
+            c.itemconfigure(title_id, state='hidden')
+            c.itemconfigure(word_id, state='hidden')
 
     # ----------------- Confetti (simple) -----------------
     def start_confetti(self, duration_ms=3000):
-        self.confetti = []
-        for _ in range(120):
-            self.confetti.append({
-                'x': random.uniform(0, CANVAS_W),
-                'y': random.uniform(-200, 0),
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(1, 4),
-                'r': random.uniform(3, 7),
-                'color': random.choice(['#EF4444','#F59E0B','#10B981','#3B82F6','#8B5CF6']),
-                'rot': random.uniform(0, math.pi*2)
-            })
+        n = 120
+        uniform = random.uniform
+        xs = [uniform(0, CANVAS_W) for _ in range(n)]
+        ys = [uniform(-200, 0) for _ in range(n)]
+        rs = [uniform(3, 7) for _ in range(n)]
+        colors = random.choices(['#EF4444','#F59E0B','#10B981','#3B82F6','#8B5CF6'], k=n)
+        # create each oval once; animation frames only move them
+        c = self.canvas
+        self.confetti = [
+            c.create_oval(x-r, y-r, x+r, y+r, fill=color, outline='', tags='confetti')
+            for x, y, r, color in zip(xs, ys, rs, colors)
+        ]
+        # only y is tracked after creation (for the off-screen cut); x lives on the canvas
+        self._confetti_y = ys
+        self._confetti_vx = [uniform(-1, 1) for _ in range(n)]
+        self._confetti_vy = [uniform(1, 4) for _ in range(n)]
         # schedule animation
+        self._confetti_delay = CONFETTI_FRAME_MS
+        self._confetti_last = None
         end_time = self._now_ms() + duration_ms
         self._confetti_step(end_time)
 
     def _confetti_step(self, end_time):
-        self.canvas.delete('confetti')
-        for p in list(self.confetti):
-            x = p['x']; y = p['y']; r = p['r']
-            # draw as small oval
-            self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=p['color'], outline='', tags='confetti')
-            # update
-            p['x'] += p['vx']; p['y'] += p['vy']; p['vy'] += 0.05
-        self.render()  # redraw rest of scene (keeps confetti on top)
-        if self._now_ms() < end_time and any(p['y'] < CANVAS_H+50 for p in self.confetti):
-            self.confetti_job = self.root.after(33, lambda: self._confetti_step(end_time))
+        # nothing to see while minimized or hidden: check back later instead of animating
+        if not self.root.winfo_viewable():
+            # the pause is not a missed frame
+            self._confetti_last = None
+            if self._now_ms() < end_time:
+                self.confetti_job = self.root.after(200, lambda: self._confetti_step(end_time))
+            else:
+                self.stop_confetti()
+            return
+        # wall-clock time since the previous frame: much longer than the delay we asked
+        # for means the event loop is falling behind
+        now = time.perf_counter()
+        late = (self._confetti_last is not None and
+                (now - self._confetti_last) * 1000 > self._confetti_delay + CONFETTI_FRAME_MS / 2)
+        self._confetti_last = now
+        c = self.canvas
+        move = c.move
+        # scale the per-frame motion so the fall speed does not depend on the frame rate
+        k = self._confetti_delay / CONFETTI_FRAME_MS
+        g = 0.05 * k
+        limit = CANVAS_H + 50
+        ids = []; ys = []; vxs = []; vys = []
+        for pid, y, vx, vy in zip(self.confetti, self._confetti_y, self._confetti_vx, self._confetti_vy):
+            dy = vy * k
+            y += dy
+            if y < limit:
+                # shift by this frame's velocity; the canvas keeps float coords
+                move(pid, vx * k, dy)
+                ids.append(pid); ys.append(y); vxs.append(vx); vys.append(vy + g)
+            else:
+                # fell off the bottom: drop its oval
+                c.delete(pid)
+        self.confetti = ids
+        self._confetti_y = ys
+        self._confetti_vx = vxs
+        self._confetti_vy = vys
+        # back off while frames arrive late; never go faster than the nominal rate
+        self._confetti_delay = CONFETTI_SLOW_MS if late else CONFETTI_FRAME_MS
+        if self._now_ms() < end_time and ids:
+            self.confetti_job = self.root.after(self._confetti_delay, lambda: self._confetti_step(end_time))
         else:
             self.stop_confetti()
 
@@ -360,6 +508,9 @@ class HangmanGame:
                 pass
             self.confetti_job = None
         self.confetti = []
+        self._confetti_y = []
+        self._confetti_vx = []
+        self._confetti_vy = []
         self.canvas.delete('confetti')
 
     def _now_ms(self):